@@ -6,8 +6,13 @@ Definitions for directed and undirected graphs.
 
 """
 
+from array import array
+from collections import namedtuple
 import csv
 import doctest
+from types import MappingProxyType
+
+import numpy as np
 
 
 class GraphError(Exception):
@@ -41,9 +46,23 @@ class GraphError(Exception):
         return f'GraphError({repr(self.message)})'
 
 
+CSR = namedtuple('CSR', ['node_ids', 'node_ilocs', 'out_indptr',
+                         'out_indices', 'in_indptr', 'in_indices'])
+CSR.__doc__ = """Compressed sparse row/column arrays of a DirectedGraph.
+
+node_ids[i] is the ID of the node at position (iloc) i, and node_ilocs
+maps IDs back to positions. The out-neighbors of the node at position
+v are out_indices[out_indptr[v]:out_indptr[v + 1]], and likewise for
+the in-neighbors with in_indptr and in_indices.
+"""
+
+
 class Node:
     r"""Represents a node in a graph.
 
+    A graph stores its nodes as arrays, so the Node returned by a
+    graph is a lightweight view that shares the graph's attributes.
+
     >>> n = Node('node1', weight=80, age=90)
     >>> n.identifier()
     'node1'
@@ -52,32 +71,40 @@ class Node:
     90
     >>> d['weight']
     80
+    >>> d['age'] = 91
+    Traceback (most recent call last):
+        ...
+    TypeError: ...
     >>> str(n)
     'Node [node1]\n    age : 90\n    weight : 80\n'
+    >>> n == Node('node1', age=90, weight=80), n == Node('node2')
+    (True, False)
     """
 
+    __slots__ = ('_identifier', '_attributes')
+
     def __init__(self, identifier, **attributes):
         """Initialize this node with the given ID.
         The keyword arguments are optional node attributes.
         """
         self._identifier = identifier
         self._attributes = attributes
-        self._in_degree = 0
-        self._out_degree = 0
-        self._in_neighbors = None
-        self._out_neighbors = None
-        self._flag_in = False
-        self._flag_in_neig = False
-        self._flag_out = False
-        self._flag_out_neig = False
+
+    @classmethod
+    def _view(cls, identifier, attributes):
+        """Return a Node that shares the given attribute dictionary."""
+        node = cls.__new__(cls)
+        node._identifier = identifier
+        node._attributes = attributes
+        return node
 
     def identifier(self):
         """Return the identifier of this node."""
         return self._identifier
 
     def attributes(self):
-        """Return a copy of this node's attribute dictionary."""
-        return self._attributes.copy()
+        """Return a read-only view of this node's attribute dictionary."""
+        return MappingProxyType(self._attributes)
 
     def __str__(self):
         """Return a string representation of this node.
@@ -88,10 +115,24 @@ class Node:
         attr_str = '\n'.join([f"    {key} : {value}" for key, value in sorted_attrs])
         return f"Node [{self._identifier}]\n{attr_str}\n"
 
+    def __eq__(self, other):
+        """Return whether other is a Node with the same ID and attributes."""
+        if not isinstance(other, Node):
+            return NotImplemented
+        return (self._identifier == other._identifier
+                and self._attributes == other._attributes)
+
+    def __hash__(self):
+        """Return a hash of this node's ID."""
+        return hash(self._identifier)
+
 
 class Edge:
     r"""Represents a directed edge in a graph.
 
+    As with Node, the Edge returned by a graph is a view that shares
+    the graph's attributes.
+
     >>> n1, n2 = Node('node1'), Node('node2')
     >>> e = Edge(n1, n2, size=3, cost=5)
     >>> d = e.attributes()
@@ -105,6 +146,8 @@ class Edge:
     'Edge from node [node1] to node [node2]\n    cost : 5\n    size : 3\n'
     """
 
+    __slots__ = ('_nodes', '_attributes')
+
     def __init__(self, node1, node2, **attributes):
         """Initialize this edge with the Nodes node1 and node2.
         The keyword arguments are optional edge attributes.
@@ -112,9 +155,17 @@ class Edge:
         self._nodes = (node1, node2)
         self._attributes = attributes
 
+    @classmethod
+    def _view(cls, node1, node2, attributes):
+        """Return an Edge that shares the given attribute dictionary."""
+        edge = cls.__new__(cls)
+        edge._nodes = (node1, node2)
+        edge._attributes = attributes
+        return edge
+
     def attributes(self):
-        """Return a copy of this edge's attribute dictionary."""
-        return self._attributes.copy()
+        """Return a read-only view of this edge's attribute dictionary."""
+        return MappingProxyType(self._attributes)
 
     def nodes(self):
         """Return a tuple of the Nodes corresponding to this edge.
@@ -133,6 +184,17 @@ class Edge:
         attr_str = '\n'.join([f"    {key} : {value}" for key, value in sorted_attrs])
         return f"Edge from node [{node1_id}] to node [{node2_id}]\n{attr_str}\n"
 
+    def __eq__(self, other):
+        """Return whether other is an Edge with the same nodes and attributes."""
+        if not isinstance(other, Edge):
+            return NotImplemented
+        return (self._nodes == other._nodes
+                and self._attributes == other._attributes)
+
+    def __hash__(self):
+        """Return a hash of this edge's nodes."""
+        return hash(self._nodes)
+
 
 class BaseGraph:
     r"""A graph where the nodes and edges have optional attributes.
@@ -164,6 +226,8 @@ class BaseGraph:
     3
     >>> g.nodes()[0].identifier()
     1
+    >>> g.nodes_id()
+    (1, 2, 3)
     >>> len(g.edges())
     2
     >>> str(g.edges()[1])
@@ -194,59 +258,160 @@ class BaseGraph:
     """
 
     def __init__(self):
-        """Initialize this graph object."""
-        self._nodes = {}
-        self._edges = {}
+        """Initialize this graph object.
+
+        Nodes and edges are stored as parallel arrays indexed by their
+        position (iloc) in insertion order.
+        """
+        self._node_ilocs = {}
+        self._node_ids = []
+        self._node_attrs = []
+        self._in_deg = array('q')
+        self._out_deg = array('q')
+        self._edge_ilocs = {}
+        self._src = array('q')
+        self._dst = array('q')
+        self._edge_attrs = []
+        self._sorted_ids_cache = None
+        self._sorted_nodes_cache = None
+        self._sorted_edges_cache = None
 
     def __len__(self):
         """Return the number of nodes in the graph."""
-        return len(self._nodes)
+        return len(self._node_ids)
 
     def add_node(self, node_id, **attributes):
         """Add a node to this graph."""
-        if node_id in self._nodes:
+        if node_id in self._node_ilocs:
             raise GraphError(f"Node {node_id} already exists in the graph.")
-        self._nodes[node_id] = Node(node_id, **attributes)
+        self._node_ilocs[node_id] = len(self._node_ids)
+        self._node_ids.append(node_id)
+        self._node_attrs.append(attributes)
+        self._in_deg.append(0)
+        self._out_deg.append(0)
+        self._sorted_ids_cache = None
+        self._sorted_nodes_cache = None
 
     def node(self, node_id):
         """Return the Node object for the node whose ID is node_id."""
-        if node_id not in self._nodes:
+        if node_id not in self._node_ilocs:
             raise GraphError(f"Node {node_id} not found in the graph.")
-        return self._nodes[node_id]
+        return Node._view(node_id, self._node_attrs[self._node_ilocs[node_id]])
 
     def nodes(self):
-        """Return a list of all the Nodes objects in this graph."""
-        return sorted(self._nodes.values(), key=lambda node: node.identifier())
+        """Return a list of all the Nodes objects in this graph.
+        The sorted nodes are cached until a node is added.
+        """
+        if self._sorted_nodes_cache is None:
+            self._sorted_nodes_cache = tuple(self.node(node_id)
+                                             for node_id in self.nodes_id())
+        return list(self._sorted_nodes_cache)
     
     def nodes_id(self):
-        """Return a list of all the Nodes ids in this graph."""
-        return sorted(self._nodes.keys())
+        """Return a sorted tuple of all the Nodes ids in this graph.
+        The tuple is cached until a node is added.
+        """
+        if self._sorted_ids_cache is None:
+            self._sorted_ids_cache = tuple(sorted(self._node_ids))
+        return self._sorted_ids_cache
 
     def add_edge(self, node1_id, node2_id, **attributes):
         """Add an edge between the nodes with the given IDs."""
         #if node1_id == node2_id:
          #   raise GraphError("Cannot add an edge from a node to itself.")
-        if (node1_id, node2_id) in self._edges:
+        if (node1_id, node2_id) in self._edge_ilocs:
             raise GraphError(f"Edge between nodes {node1_id} and {node2_id} already exists in the graph.")
-        if node1_id not in self._nodes or node2_id not in self._nodes:
+        if node1_id not in self._node_ilocs or node2_id not in self._node_ilocs:
             raise GraphError("Nodes for the edge not found in the graph.")
-        self._edges[(node1_id, node2_id)] = Edge(self.node(node1_id), self.node(node2_id), **attributes)
-        node1 = self._nodes[node1_id]
-        node2 = self._nodes[node2_id]
-        node1._flag_out = False
-        node1._flag_out_neig = False
-        node2._flag_in = False
-        node2._flag_in_neig = False
+        self._edge_ilocs[(node1_id, node2_id)] = len(self._edge_attrs)
+        src, dst = self._node_ilocs[node1_id], self._node_ilocs[node2_id]
+        self._src.append(src)
+        self._dst.append(dst)
+        self._edge_attrs.append(attributes)
+        self._out_deg[src] += 1
+        self._in_deg[dst] += 1
+        self._sorted_edges_cache = None
+
+    def _add_edges(self, node1_ids, node2_ids, attributes):
+        r"""Add edges given as parallel sequences of node IDs and
+        attribute dictionaries, as if by calling add_edge on each.
+        The graph is left unchanged if any of the edges is invalid.
+
+        >>> g = BaseGraph()
+        >>> g.add_node(1)
+        >>> g.add_node(2)
+        >>> g.add_edge(1, 2)
+        >>> g._add_edges([2, 2], [1, 2], [{'w': '5'}, {}])
+        >>> str(g.edge(2, 1))
+        'Edge from node [2] to node [1]\n    w : 5\n'
+        >>> for batch in (([1, 1], [1, 1]), ([2], [1]), ([1], [3])):
+        ...     try:
+        ...         g._add_edges(*batch, [{}] * len(batch[0]))
+        ...     except GraphError as e:
+        ...         print(e)
+        Edge between nodes 1 and 1 already exists in the graph.
+        Edge between nodes 2 and 1 already exists in the graph.
+        Nodes for the edge not found in the graph.
+        >>> len(g.edges()), list(g._out_deg), list(g._in_deg)
+        (3, [1, 2], [1, 2])
+        """
+        num_edges = len(self._edge_attrs)
+        keys = list(zip(node1_ids, node2_ids))
+        new_edge_ilocs = dict(zip(keys, range(num_edges, num_edges + len(keys))))
+        if (len(new_edge_ilocs) < len(keys)
+                or not self._edge_ilocs.keys().isdisjoint(new_edge_ilocs)):
+            # Report the first edge that repeats an earlier one
+            seen = set()
+            for node1_id, node2_id in keys:
+                if (node1_id, node2_id) in self._edge_ilocs or (node1_id, node2_id) in seen:
+                    raise GraphError(f"Edge between nodes {node1_id} and {node2_id} already exists in the graph.")
+                seen.add((node1_id, node2_id))
+        try:
+            src = list(map(self._node_ilocs.__getitem__, node1_ids))
+            dst = list(map(self._node_ilocs.__getitem__, node2_ids))
+        except KeyError:
+            raise GraphError("Nodes for the edge not found in the graph.") from None
+        self._edge_ilocs.update(new_edge_ilocs)
+        self._src.extend(src)
+        self._dst.extend(dst)
+        self._edge_attrs.extend(attributes)
+        num_nodes = len(self._node_ids)
+        for degrees, ilocs in ((self._out_deg, src), (self._in_deg, dst)):
+            # Sum into a copy rather than a view of the degree array, which
+            # could not be resized while the view was alive
+            summed = np.array(degrees, dtype=np.int64)
+            summed += np.bincount(np.array(ilocs, dtype=np.int64), minlength=num_nodes)
+            degrees[:] = array('q', summed.tobytes())
+        self._sorted_edges_cache = None
 
     def edge(self, node1_id, node2_id):
         """Return the Edge object for the edge between the given nodes."""
-        if (node1_id, node2_id) not in self._edges:
+        if (node1_id, node2_id) not in self._edge_ilocs:
             raise GraphError(f"Edge between nodes {node1_id} and {node2_id} not found in the graph.")
-        return self._edges[(node1_id, node2_id)]
+        return Edge._view(self.node(node1_id), self.node(node2_id),
+                          self._edge_attrs[self._edge_ilocs[(node1_id, node2_id)]])
 
     def edges(self):
-        """Return a list of all the edges in this graph."""
-        return sorted(self._edges.values(), key=lambda edge: (edge.nodes()[0].identifier(), edge.nodes()[1].identifier()))
+        """Return a list of all the edges in this graph.
+        The sorted edges are cached until an edge is added.
+        """
+        if self._sorted_edges_cache is None:
+            # Rank each node by its ID, then sort the edges by the ranks
+            # of their endpoints
+            sorted_ilocs = np.array([self._node_ilocs[node_id]
+                                     for node_id in self.nodes_id()],
+                                    dtype=np.int64)
+            node_rank = np.empty(len(sorted_ilocs), dtype=np.int64)
+            node_rank[sorted_ilocs] = np.arange(len(sorted_ilocs))
+            src = np.array(self._src, dtype=np.int64)
+            dst = np.array(self._dst, dtype=np.int64)
+            order = np.lexsort((node_rank[dst], node_rank[src]))
+            self._sorted_edges_cache = tuple(
+                Edge._view(self.node(self._node_ids[src[k]]),
+                           self.node(self._node_ids[dst[k]]),
+                           self._edge_attrs[k])
+                for k in order.tolist())
+        return list(self._sorted_edges_cache)
 
     def __getitem__(self, key):
         """Return the Node or Edge corresponding to the given key."""
@@ -257,8 +422,8 @@ class BaseGraph:
     def __contains__(self, item):
         """Return whether the given node or edge is in the graph."""
         if isinstance(item, tuple):
-            return item in self._edges
-        return item in self._nodes
+            return item in self._edge_ilocs
+        return item in self._node_ilocs
 
     def __str__(self):
         """Return a string representation of the graph."""
@@ -325,16 +490,48 @@ class UndirectedGraph(BaseGraph):
         super().add_edge(node1_id, node2_id, **attributes)
         super().add_edge(node2_id, node1_id, **attributes)
 
+    def _add_edges(self, node1_ids, node2_ids, attributes):
+        """Add undirected edges given as parallel sequences, as if by
+        calling add_edge on each.
+
+        >>> g, h = UndirectedGraph(), UndirectedGraph()
+        >>> for node_id in (1, 2, 3):
+        ...     g.add_node(node_id)
+        ...     h.add_node(node_id)
+        >>> g._add_edges([1, 2], [2, 3], [{'c': 3}, {}])
+        >>> h.add_edge(1, 2, c=3)
+        >>> h.add_edge(2, 3)
+        >>> list(g._edge_ilocs)
+        [(1, 2), (2, 1), (2, 3), (3, 2)]
+        >>> list(g._edge_ilocs) == list(h._edge_ilocs), str(g) == str(h)
+        (True, True)
+        >>> for batch in (([3], [3]), ([1, 3], [3, 1])):
+        ...     try:
+        ...         g._add_edges(*batch, [{}] * len(batch[0]))
+        ...     except GraphError as e:
+        ...         print(e)
+        Cannot add a self-loop in an undirected graph.
+        Edge between nodes 3 and 1 already exists in the graph.
+        >>> len(g.edges()), g.degree(1), g.degree(3)
+        (4, 1, 1)
+        """
+        if any(node1_id == node2_id
+               for node1_id, node2_id in zip(node1_ids, node2_ids)):
+            raise GraphError("Cannot add a self-loop in an undirected graph.")
+        # Interleave both directions, in the order add_edge adds them;
+        # the two directions share one attribute dictionary
+        forward = [ids for pair in zip(node1_ids, node2_ids) for ids in pair]
+        backward = [ids for pair in zip(node2_ids, node1_ids) for ids in pair]
+        both_attributes = [attrs for attrs in attributes for _ in range(2)]
+        super()._add_edges(forward, backward, both_attributes)
+
     def degree(self, node_id):
         """Return the degree of the node with the given ID."""
-        if node_id not in self._nodes:
+        if node_id not in self._node_ilocs:
             raise GraphError(f"Node {node_id} not found in the graph.")
-        degree_count = 0
-
-        for edge_nodes in self._edges.keys():
-            if node_id in edge_nodes:
-                degree_count += 1
-        return int(degree_count/2)
+        # Each undirected edge is stored in both directions, so the
+        # out-degree counts every neighbor exactly once
+        return self._out_deg[self._node_ilocs[node_id]]
 
 
 class DirectedGraph(BaseGraph):
@@ -395,70 +592,144 @@ class DirectedGraph(BaseGraph):
     >>> g.add_edge(1,5)
     >>> g.in_neighbors(5)
     [4, 2, 1]
+    >>> g.in_neighbors(1), g.out_neighbors(1)
+    ([1], [2, 1, 5])
+    >>> g.sinks()
+    [5]
     """
 
     def __init__(self):
         """Initialize this DirectedGraph object."""
         super().__init__()
+        self._csr = None
+        # Used as an insertion-ordered set of the IDs of the nodes with
+        # no outgoing edges
+        self._sinks = {}
+
+    def add_node(self, node_id, **attributes):
+        """Add a node to this graph."""
+        super().add_node(node_id, **attributes)
+        self._csr = None
+        self._sinks[node_id] = None
+
+    def add_edge(self, node1_id, node2_id, **attributes):
+        """Add a directed edge between the nodes with the given IDs."""
+        super().add_edge(node1_id, node2_id, **attributes)
+        self._csr = None
+        self._sinks.pop(node1_id, None)
+
+    def _add_edges(self, node1_ids, node2_ids, attributes):
+        """Add directed edges given as parallel sequences, as if by
+        calling add_edge on each.
+        """
+        super()._add_edges(node1_ids, node2_ids, attributes)
+        self._csr = None
+        for node_id in node1_ids:
+            self._sinks.pop(node_id, None)
+
+    def sinks(self):
+        """Return a list of the IDs of the nodes with no outgoing edges,
+        in the order the nodes were added.
+        """
+        return list(self._sinks)
+
+    def _finalize(self):
+        """Return the CSR arrays of this graph, building them if needed.
+
+        Nodes are identified by their positions 0..N-1 in insertion
+        order. The arrays are cached until the graph is next modified.
+        """
+        if self._csr is None:
+            num_nodes = len(self._node_ids)
+            src = np.array(self._src, dtype=np.int64)
+            dst = np.array(self._dst, dtype=np.int64)
+
+            out_indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+            np.cumsum(self._out_deg, out=out_indptr[1:])
+            in_indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+            np.cumsum(self._in_deg, out=in_indptr[1:])
+
+            # A stable sort keeps each neighbor list in edge insertion order
+            out_indices = dst[np.argsort(src, kind='stable')]
+            in_indices = src[np.argsort(dst, kind='stable')]
+            # Snapshot the positions so the CSR stays consistent after
+            # the graph changes, and cannot be used to modify the graph
+            self._csr = CSR(tuple(self._node_ids),
+                            MappingProxyType(dict(self._node_ilocs)),
+                            out_indptr, out_indices, in_indptr, in_indices)
+        return self._csr
+
+    def csr(self):
+        """Return the CSR arrays of this graph as a CSR namedtuple.
+
+        >>> g = DirectedGraph()
+        >>> g.add_node('a')
+        >>> c = g.csr()
+        >>> g.add_node('b')
+        >>> c.node_ids, dict(c.node_ilocs)
+        (('a',), {'a': 0})
+        >>> c.node_ilocs['b'] = 1
+        Traceback (most recent call last):
+            ...
+        TypeError: ...
+        """
+        return self._finalize()
 
     def in_degree(self, node_id):
         """Return the in-degree of the node with the given ID."""
-        if node_id not in self._nodes:
+        if node_id not in self._node_ilocs:
             raise GraphError(f"Node {node_id} not found in the graph.")
-        
-        node = self._nodes[node_id]
-        if node._flag_in is False:
-            node._flag_in = True          
-            in_degree_count = 0
-            for edge_nodes in self._edges.keys():
-                if node_id == edge_nodes[1]:
-                    in_degree_count += 1
-            node._in_degree = in_degree_count
-        return in_degree_count
+        return self._in_deg[self._node_ilocs[node_id]]
 
     def out_degree(self, node_id):
         """Return the out-degree of the node with the given ID."""
-        if node_id not in self._nodes:
+        if node_id not in self._node_ilocs:
             raise GraphError(f"Node {node_id} not found in the graph.")
-        
-        node = self._nodes[node_id]
-        if node._flag_out is False:
-            node._flag_out = True
-            out_degree_count = 0
-            for edge_nodes in self._edges.keys():
-                if node_id == edge_nodes[0]:
-                    out_degree_count += 1
-            node._out_degree = out_degree_count
-        return node._out_degree
-        
-    
+        return self._out_deg[self._node_ilocs[node_id]]
+
     def out_neighbors(self, node_id):
         """Return a list of out-neighbors for the node with the given ID."""
-        if node_id not in self._nodes:
+        if node_id not in self._node_ilocs:
             raise GraphError(f"Node {node_id} not found in the graph.")
-        
-        node = self._nodes[node_id]
-        if node._flag_out_neig is False:
-            node._flag_out_neig = True
-            for node in self._nodes.values():
-                node._out_neighbors = []  # Initialize out-neighbors as an empty list
-            for (src, dest) in self._edges.keys():
-                self._nodes[src]._out_neighbors.append(dest)
-        return node._out_neighbors
-    
+        csr = self._finalize()
+        v = csr.node_ilocs[node_id]
+        neighbors = csr.out_indices[csr.out_indptr[v]:csr.out_indptr[v + 1]]
+        return [csr.node_ids[i] for i in neighbors.tolist()]
+
     def in_neighbors(self, node_id):
         """Return a list of in-neighbors for the node with the given ID."""
-        if node_id not in self._nodes:
+        if node_id not in self._node_ilocs:
             raise GraphError(f"Node {node_id} not found in the graph.")
-    
-        node = self._nodes[node_id]
-        if node._flag_in_neig is False:
-            node._flag_in_neig = True
-            for node in self._nodes.values():
-                node._in_neighbors = []  # Initialize in-neighbors as an empty list
-            for (src, dest) in self._edges.keys():
-                self._nodes[dest]._in_neighbors.append(src)
-        return node._in_neighbors
+        csr = self._finalize()
+        v = csr.node_ilocs[node_id]
+        neighbors = csr.in_indices[csr.in_indptr[v]:csr.in_indptr[v + 1]]
+        return [csr.node_ids[i] for i in neighbors.tolist()]
+
+
+def _read_csv_columns(filename, num_ids):
+    """Read a node or edge CSV file column by column.
+
+    Returns a list with the first num_ids columns, which hold node IDs,
+    and a list with one attribute dictionary per row, keyed by the
+    names of the remaining columns in the header.
+    """
+    with open(filename, 'r', encoding="utf8") as csv_data:
+        reader = csv.reader(csv_data)
+        header = next(reader)
+        attr_names = header[num_ids:]
+        rows = list(reader)
+    if rows and min(map(len, rows)) < len(header):
+        for row_num, row in enumerate(rows, start=1):
+            if len(row) < len(header):
+                raise GraphError(f"Row {row_num} of {filename} has {len(row)} fields, "
+                                 f"but its header has {len(header)}.")
+    id_columns = [[row[i] for row in rows] for i in range(num_ids)]
+    if not attr_names:
+        # Rows without attributes share one empty dictionary; graphs
+        # never mutate the attribute dictionaries they store
+        return id_columns, [{}] * len(rows)
+    attributes = [dict(zip(attr_names, row[num_ids:])) for row in rows]
+    return id_columns, attributes
 
 
 def read_graph_from_csv(node_file, edge_file, directed=False):
@@ -467,22 +738,13 @@ def read_graph_from_csv(node_file, edge_file, directed=False):
     Refer to the project specification for the file formats.
     """
     result = DirectedGraph() if directed else UndirectedGraph()
-    for i, filename in enumerate((node_file, edge_file)):
-        attr_start = i + 1
-        with open(filename, 'r', encoding="utf8") as csv_data:
-            reader = csv.reader(csv_data)
-            header = next(reader)
-            attr_names = header[attr_start:]
-
-            for line in reader:
-                identifier, attr_values = (line[:attr_start],
-                                           line[attr_start:])
-                attributes = {attr_names[i]: attr_values[i]
-                              for i in range(len(attr_names))}
-                if i == 0:
-                    result.add_node(*identifier, **attributes)
-                else:
-                    result.add_edge(*identifier, **attributes)
+    (node_ids,), node_attributes = _read_csv_columns(node_file, 1)
+    for node_id, attributes in zip(node_ids, node_attributes):
+        result.add_node(node_id, **attributes)
+
+    # Edges are added in bulk, straight into the graph's edge arrays
+    (node1_ids, node2_ids), edge_attributes = _read_csv_columns(edge_file, 2)
+    result._add_edges(node1_ids, node2_ids, edge_attributes)
     return result
 
 
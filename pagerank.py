@@ -20,9 +20,54 @@ tests.
 
 """
 
+import heapq
+import math
 import sys
+
+import numpy as np
+
 import graph
 
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; fall back to plain NumPy
+    njit = None
+
+
+def _pagerank_iter(in_indptr, in_indices, in_weights, pr, base, new_pr):
+    """Write the PageRank values after one iteration from pr to new_pr.
+
+    in_indptr and in_indices are the in-edge (CSC) arrays of the graph,
+    in_weights holds the damped inverse out-degree of the source of each
+    in-edge and base is the rank every node receives regardless of its
+    in-edges (random jumps plus the damped rank of the sinks).
+    """
+    # Pad with a zero so that np.add.reduceat accepts a start index equal
+    # to the number of edges, then zero out the rows with no in-edges.
+    contrib = np.append(pr[in_indices] * in_weights, 0.0)
+    np.add.reduceat(contrib, in_indptr[:-1], out=new_pr)
+    new_pr[in_indptr[:-1] == in_indptr[1:]] = 0.0
+    new_pr += base
+
+
+if njit is not None:
+    @njit('void(int64[:], int64[:], float64[:], float64[:], float64, '
+          'float64[:])',
+          cache=True, fastmath=True, parallel=True)
+    def _pagerank_iter(in_indptr, in_indices, in_weights, pr, base, new_pr):
+        """Write the PageRank values after one iteration from pr to new_pr.
+
+        Compiled version of the NumPy function above, which sums each
+        node's in-neighbor contributions in a single fused loop. Rows
+        are independent, so they are split across threads with prange.
+        """
+        for v in prange(in_indptr.shape[0] - 1):
+            row_sum = 0.0
+            for k in range(in_indptr[v], in_indptr[v + 1]):
+                row_sum += pr[in_indices[k]] * in_weights[k]
+            new_pr[v] = base + row_sum
+
+
 def find_sinks(digraph):
     """Find sinks - nodes with no outgoing links
     >>> g = graph.DirectedGraph()
@@ -35,30 +80,23 @@ def find_sinks(digraph):
     >>> g.add_node(3)
     >>> find_sinks(g)
     [2, 3]
-    """
-    sinks = []
-    for node_id in digraph.nodes_id():
-        if digraph.out_degree(node_id) == 0:
-            sinks.append(node_id)
-    return sinks
 
-def handle_sinks(pagerank_values, sinks, tot_nodes):
-    """Distribute sink ranks evenly across all nodes."""
-    sink_rank_sum = 0
-
-    # Sum the ranks of all sink nodes and change sink pages ranks
-    for node_id in sinks:
-        pagerank_values[node_id] /= tot_nodes
-        sink_rank_sum += pagerank_values[node_id] 
-
-    return sink_rank_sum
+    Sinks are returned in sorted ID order, not in insertion order:
 
+    >>> h = graph.DirectedGraph()
+    >>> h.add_node(3)
+    >>> h.add_node(1)
+    >>> find_sinks(h)
+    [1, 3]
+    """
+    return sorted(digraph.sinks())
 
 def pagerank(digraph, num_iterations=100, tol = 1e-6, damping_factor=.85):
     """Calculate the PageRank for the nodes in the given digraph.
 
     In num_iterations iterations, calculates the PageRank for all
-    nodes in the given digraph accepting a certain tollerance (tol). 
+    nodes in the given digraph accepting a certain tollerance (tol) 
+    on the largest change of any node's PageRank in an iteration. 
     Returns a dictionary mapping node IDs to their PageRank. 
     Each node starts with an initial PageRank value of 
     1/N, where N is the number of nodes in the graph.
@@ -84,32 +122,47 @@ def pagerank(digraph, num_iterations=100, tol = 1e-6, damping_factor=.85):
     True
     """
 
-    # Step 1: Initialize the PageRank values for all nodes
-    num_nodes = len(digraph)
-    initial_pagerank = 1 / num_nodes
-    pagerank_values = {node_id: initial_pagerank for node_id in digraph.nodes_id()}
+    # Step 1: Initialize the PageRank values for all nodes, indexed by
+    # each node's position in the graph's CSR arrays
+    csr = digraph.csr()
+    num_nodes = len(csr.node_ids)
+    pagerank_values = np.full(num_nodes, 1 / num_nodes)
     random_factor = (1 - damping_factor) / num_nodes
-    sinks_list = find_sinks(digraph)
-
-    # Step 2: Perform multiple iterations to update the PageRank values
-    for _ in range(num_iterations): 
-        # Handle sinks
-        sink_rank_sum = handle_sinks(pagerank_values, sinks_list, num_nodes) * damping_factor
-        new_pagerank_values = {node_id: random_factor + sink_rank_sum for node_id in digraph.nodes_id()}
-
-        for node_id in digraph.nodes_id():
-            for neighbor_id in digraph.in_neighbors(node_id):
-                new_pagerank_values[node_id] += damping_factor * pagerank_values[neighbor_id] / digraph.out_degree(neighbor_id)
-        
-        # Control convergence
-        error = sum(abs(new_pagerank_values[node_id] - pagerank_values[node_id]) for node_id in pagerank_values)
+    sinks_list = np.array([csr.node_ilocs[node_id] for node_id in find_sinks(digraph)],
+                          dtype=np.int64)
+
+    # The graph cannot change while iterating, so take its in-edges once
+    in_indptr, in_indices = csr.in_indptr, csr.in_indices
+
+    # Damped inverse out-degrees, with zero for sinks, gathered once per
+    # in-edge so that each iteration only multiplies by them
+    out_degrees = np.diff(csr.out_indptr)
+    inv_out = np.zeros(num_nodes)
+    np.divide(damping_factor, out_degrees, out=inv_out, where=out_degrees > 0)
+    in_weights = inv_out[in_indices]
+
+    # Step 2: Perform multiple iterations to update the PageRank values,
+    # alternating between two preallocated buffers
+    new_pagerank_values = np.empty(num_nodes)
+    diff = np.empty(num_nodes)
+    for _ in range(num_iterations):
+        # Sinks have no links to follow, so their rank is spread evenly
+        # across all nodes
+        sink_rank_sum = damping_factor * pagerank_values[sinks_list].sum() / num_nodes
+        _pagerank_iter(in_indptr, in_indices, in_weights,
+                       pagerank_values, random_factor + sink_rank_sum,
+                       new_pagerank_values)
+
+        # Control convergence: stop once no rank changes by more than tol
+        np.subtract(new_pagerank_values, pagerank_values, out=diff)
+        error = np.abs(diff, out=diff).max()
         if error < tol:
             print("Convergence reached.")
             break
         print("At ite ",_," error = ", error)
-        pagerank_values = new_pagerank_values
+        pagerank_values, new_pagerank_values = new_pagerank_values, pagerank_values
 
-    return pagerank_values
+    return dict(zip(csr.node_ids, pagerank_values.tolist()))
 
 
 
@@ -124,17 +177,17 @@ def print_ranks(ranks, max_nodes=20):
     if max_nodes not in range(len(ranks)):
         max_nodes = len(ranks)
 
-    # sort ids highest to lowest primarily by rank value, secondarily by id itself
-    sorted_ids = sorted(ranks.keys(),
-                        key=lambda node: (round(ranks[node], 5), node),
-                        reverse=True)
-    for node_id in sorted_ids[:max_nodes]:
-        print(f'{node_id}: {ranks[node_id]:.5f}')
+    # select the top ids, highest to lowest primarily by rank value,
+    # secondarily by id itself
+    top_ranks = heapq.nlargest(max_nodes, ranks.items(),
+                               key=lambda item: (round(item[1], 5), item[0]))
+    for node_id, rank in top_ranks:
+        print(f'{node_id}: {rank:.5f}')
     if max_nodes < len(ranks):
         print('...')
 
-    # compute sum using sorted ids to bypass randomness in dict implementation
-    print(f'Sum: {(sum(ranks[n] for n in sorted_ids)):.5f}')
+    # fsum is exactly rounded, so the sum does not depend on dict order
+    print(f'Sum: {math.fsum(ranks.values()):.5f}')
 
 
 def pagerank_from_csv(node_file, edge_file, num_iterations):